@@ -2,12 +2,27 @@
 
 import argparse
 
-from chess.solvers import SOLVERS_LIST, SOLVERS_DICT
+from chess.solvers import SOLVERS_LIST, SOLVERS_DICT, MEMOIZE_BITS_DEFAULT, MEMOIZE_BITS_MAX
 from chess.structures import PIECES_LIST
 from chess.utils import piece_character, piece_pluralized
 from chess.formats import FORMAT_DICT, FORMAT_DEFAULT
 
 
+def memoize_bits(value: str) -> int:
+    """Parses the size in bits of the explored configurations table
+
+    Args:
+        value: Command line value
+
+    Returns:
+        Size in bits between 0 and MEMOIZE_BITS_MAX
+    """
+    bits = int(value)
+    if not 0 <= bits <= MEMOIZE_BITS_MAX:
+        raise argparse.ArgumentTypeError('must be between 0 and %d' % MEMOIZE_BITS_MAX)
+    return bits
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(
         prog='ChessChallenge',
@@ -47,6 +62,15 @@ if __name__ == '__main__':
         help='which format use to represent the solution in the output'
     )
 
+    parser.add_argument(
+        '-mb', '--memoize-bits',
+        dest='memoize_bits',
+        type=memoize_bits, default=MEMOIZE_BITS_DEFAULT,
+        required=False,
+        help='size in bits (0 to %d) of the table of explored configurations, which uses '
+             '2^N * 8 bytes, 2 GiB at most (per worker process with the parallel solver)' % MEMOIZE_BITS_MAX
+    )
+
     parser.add_argument(
         '-V', '--version',
         action='version',
@@ -68,7 +92,7 @@ if __name__ == '__main__':
     pieces = [(piece, getattr(args, piece.name())) for piece in PIECES_LIST if getattr(args, piece.name()) > 0]
 
     solver = SOLVERS_DICT[args.solver](
-        rows, cols, pieces
+        rows, cols, pieces, memoize_bits=args.memoize_bits
     )
 
     print_formatted = FORMAT_DICT[args.output_format]
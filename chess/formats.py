@@ -23,10 +23,11 @@ def print_matrix_format(board: Board):
     Args:
         board: Solution board
     """
+    state = board.state
     for row in range(board.rows):
         for col in range(board.cols):
-            if board.state[row][col] > 1:
-                print(_PIECE_TRANSLATION[board.state[row][col]], end=' ')
+            if state[row][col] > 1:
+                print(_PIECE_TRANSLATION[state[row][col]], end=' ')
             else:
                 print('-', end=' ')
         print()
@@ -57,11 +58,12 @@ def print_fancy_format(board: Board):
     for _ in range(board.cols - 1):
         print('───', end='┬')
     print('───┐')
+    state = board.state
     for row in range(board.rows):
         print('│', end='')
         for col in range(board.cols):
-            if board.state[row][col] > 1:
-                print(' %s ' % _ART_TRANSLATION[board.state[row][col]], end='│')
+            if state[row][col] > 1:
+                print(' %s ' % _ART_TRANSLATION[state[row][col]], end='│')
             else:
                 print('   ', end='│')
         print()
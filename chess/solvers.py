@@ -7,15 +7,23 @@ This module contains classes which responsibility is to solve the chess challeng
 Attributes:
     SOLVERS_LIST (tuple): List of available solvers
     SOLVERS_DICT (dict): Dictionary which maps identifiers to solvers
+    MEMOIZE_BITS_DEFAULT (int): Default size in bits of the explored configurations table
+    MEMOIZE_BITS_MAX (int): Maximum size in bits of the explored configurations table
 """
 
 from abc import ABCMeta, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from time import time
 
-from .structures import Board
+from .structures import Board, ZOBRIST_MASK, attack_masks, board_symmetries, zobrist_keys
 from .utils import piece_pluralized, capitalized
 
 
+MEMOIZE_BITS_DEFAULT = 20
+
+MEMOIZE_BITS_MAX = 28
+
 _SOLVER_REPR_TEMPLATE = '''Solver     : %s
 Board size : (%s, %s)
 Pieces     :
@@ -80,69 +88,310 @@ class Solver(metaclass=ABCMeta):
         """Time used for the computation in seconds"""
         return self._time
 
-def in_some(query_set, full_set):
-    if query_set in full_set:
-        return True
-    for set_sample in full_set:
-        if query_set in set_sample:
-            return True
-    return False
-
-
 
 class RecursiveBruteForceSolver(Solver):
     """ Recursive brute force solver
 
     Uses a recursive backtracking technique to test all possible solutions.
-    The solver uses the sets ``completed_set`` and ``solutions_set`` to avoid
-    repeating calculations from the same combination of pieces and locations.
+    The solver uses the ``completed_table`` and the ``solutions_set`` dictionary of
+    board Zobrist hashes to avoid repeating calculations from the same combination
+    of pieces and locations.
 
+    The ``completed_table`` is a fixed size open address table indexed by the lower
+    *memoize_bits* bits of the hashes, so it takes ``8 * 2^memoize_bits`` bytes.
+    Colliding configurations overwrite each other, which can only cause some
+    configurations to be explored again.
 
+    The search starts by placing the piece of the scarcest kind only in one slot
+    of every class of symmetric slots. The remaining solutions are obtained by
+    applying the board symmetries to the solutions found.
+
+    Args:
+        rows: Row count
+        cols: Column count
+        pieces: List of tuples of two elements (Piece, Count)
+        memoize_bits (optional): Size in bits of the explored configurations table, between
+            0 and ``MEMOIZE_BITS_MAX``
+
+    Raises:
+        ValueError: If *memoize_bits* is out of range
     """
 
-    completed_set = None
+    completed_table = None
     solutions_set = None
 
+    def __init__(self, rows: int, cols: int, pieces: list, memoize_bits: int=MEMOIZE_BITS_DEFAULT):
+        super().__init__(rows, cols, pieces)
+        if not 0 <= memoize_bits <= MEMOIZE_BITS_MAX:
+            raise ValueError('memoize_bits must be between 0 and %d' % MEMOIZE_BITS_MAX)
+        self.memoize_bits = memoize_bits
+
     @classmethod
     def identifier(cls):
         return 'recursive'
 
+    def _available_pieces(self) -> list:
+        """Pieces vector used by the recursion
+
+        Pieces are referred by their identifiers (see ``PIECES_DICT``), sorted in
+        increasing order. Each entry also holds the attack masks and the Zobrist keys
+        of the piece for the board size, so placing a piece in the recursion is a
+        couple of table lookups and bitwise operations.
+
+        Returns:
+            list: List of lists of five elements [PieceId, Count, Last, Masks, Keys]
+        """
+        return sorted([piece.identifier(), count, -1,
+                       attack_masks(piece.identifier(), self.rows, self.cols),
+                       zobrist_keys(piece.identifier(), self.rows, self.cols)]
+                      for piece, count in self.pieces if count > 0)
+
+    def _root(self, pieces: list) -> int:
+        """Index of the kind of piece placed first, the one with the fewest pieces
+
+        Args:
+            pieces: List of lists of five elements [PieceId, Count, Last, Masks, Keys]
+
+        Returns:
+            int: Index in *pieces*
+        """
+        return min(range(len(pieces)), key=lambda index: pieces[index][1])
+
+    def _root_squares(self) -> list:
+        """Slots tried for the first piece, one for each class of symmetric slots
+
+        Returns:
+            list: Slot numbers
+        """
+        permutations = board_symmetries(self.rows, self.cols)
+        return [square for square in range(self.rows * self.cols)
+                if square == min(permutation[square] for permutation in permutations)]
+
+    @staticmethod
+    def _symmetric_solutions(solution: Board, seen: dict):
+        """Generator of the not seen solutions symmetric to a solution, itself included
+
+        Args:
+            solution: Solution board
+            seen: Dictionary with the Zobrist hashes of the solutions already yielded
+
+        Yields:
+            Board: Solution board
+        """
+        for permutation in solution.symmetries():
+            board = solution.transform(permutation)
+            if board.zhash not in seen:
+                seen[board.zhash] = True
+                yield board
+
     def _solutions(self):
-        available_pieces = []
-        for piece, count in self.pieces:
-            for _ in range(count):
-                available_pieces.append(piece())
+        available_pieces = self._available_pieces()
+        if not available_pieces:
+            return
+
+        root = self._root(available_pieces)
+        seen = {}
+        for square in self._root_squares():
+            for solution in RecursiveBruteForceSolver._solutions_subtree(
+                    self.rows, self.cols, available_pieces, [(root, square)], self.memoize_bits):
+                yield from RecursiveBruteForceSolver._symmetric_solutions(solution, seen)
+
+    @staticmethod
+    def _solutions_subtree(rows: int, cols: int, pieces: list, roots: list, memoize_bits: int):
+        """Generator of the solutions which start with the given pieces placements
 
-        RecursiveBruteForceSolver.completed_set = set()
-        RecursiveBruteForceSolver.solutions_set = set()
+        Every root placement is the next piece of its kind, so it must be placed after
+        the previous pieces of the same kind.
 
-        board = Board.new(self.rows, self.cols)
-        yield from RecursiveBruteForceSolver._solutions_recursive(board, available_pieces)
+        Args:
+            rows: Row count
+            cols: Column count
+            pieces: List of lists of five elements [PieceId, Count, Last, Masks, Keys]
+            roots: List of tuples of two elements (Index, Slot) with the index in *pieces*
+                of the kind placed and its slot number, in placement order
+            memoize_bits: Size in bits of the explored configurations table
+
+        Yields:
+            Board: Solution board
+        """
+        pieces = [counter.copy() for counter in pieces]
+        board = Board.new(rows, cols)
+        for index, square in roots:
+            counter = pieces[index]
+            if square <= counter[2] or board.place(counter[0], square, counter[3][square]) is None:
+                return
+            counter[1] -= 1
+            counter[2] = square
+
+        RecursiveBruteForceSolver.completed_table = array('Q', [0]) * (1 << memoize_bits)
+        RecursiveBruteForceSolver.solutions_set = {}
+
+        remaining = sum(counter[1] for counter in pieces)
+        if remaining == 0:
+            yield board
+        else:
+            yield from RecursiveBruteForceSolver._solutions_recursive(
+                board, board.occ, board.atk, board.zhash, [], pieces, remaining)
 
     @staticmethod
-    def _solutions_recursive(board: Board, pieces: list):
-        if board.next_position()[0] is not None:
-            next_board = board.copy()
-            for index, piece in enumerate(pieces):
-                if index > 0 and piece.__class__ == pieces[index - 1].__class__:
+    def _solutions_recursive(board: Board, occ: int, atk: int, zhash: int, placed: list, pieces: list,
+                             remaining: int):
+        """Generator of the solutions reachable from a board
+
+        The search state is kept in plain integers, *board* is only used to build
+        the solutions.
+
+        Args:
+            board: Board with the root placements (one or two pieces) placed
+            occ: Bitboard of the occupied slots
+            atk: Bitboard of the attacked slots
+            zhash: Zobrist hash of the pieces placed
+            placed: List of tuples of three elements (PieceId, Slot, Mask) with the pieces
+                placed after the ones in *board*
+            pieces: List of lists of five elements [PieceId, Count, Last, Masks, Keys] with
+                the pieces left to place, the slot number of the last piece of the kind
+                placed, the attack masks and the Zobrist keys of the kind
+            remaining: Total count of pieces left to place
+
+        Pieces of the same kind are placed in increasing slot order, so every
+        arrangement of equal pieces is visited only once.
+
+        Yields:
+            Board: Solution board
+        """
+        completed_table = RecursiveBruteForceSolver.completed_table
+        completed_mask = len(completed_table) - 1
+        solutions_set = RecursiveBruteForceSolver.solutions_set
+
+        free = ~(occ | atk) & board.full
+        if free:
+            last = remaining == 1
+            for counter in pieces:
+                piece_id, count, last_square, masks, keys = counter
+                if not count:
                     continue
-                for next_row, next_col in board.available_positions():
-                    if next_board.add_piece(piece, next_row, next_col):
-                        if len(pieces) == 1 and hash(frozenset(next_board.pieces)) not in RecursiveBruteForceSolver.solutions_set:
-                            RecursiveBruteForceSolver.solutions_set.add(hash(frozenset(next_board.pieces)))
-                            yield next_board
-                        elif hash(frozenset(next_board.pieces)) not in RecursiveBruteForceSolver.completed_set:
-                            next_pieces = pieces.copy()
-                            del next_pieces[index]
-                            yield from RecursiveBruteForceSolver._solutions_recursive(next_board, next_pieces)
-                        next_board = board.copy()
+                candidates = free >> (last_square + 1) << (last_square + 1)
+                while candidates:
+                    bit = candidates & -candidates
+                    candidates ^= bit
+                    square = bit.bit_length() - 1
+                    mask = masks[square]
+                    if mask & occ:
+                        continue
+                    h = (zhash + keys[square]) & ZOBRIST_MASK
+                    if last and h not in solutions_set:
+                        solutions_set[h] = True
+                        solution = board.copy()
+                        for placed_id, placed_square, placed_mask in placed:
+                            solution.place(placed_id, placed_square, placed_mask)
+                        solution.place(piece_id, square, mask)
+                        yield solution
+                    elif completed_table[h & completed_mask] != h:
+                        counter[1] -= 1
+                        counter[2] = square
+                        placed.append((piece_id, square, mask))
+                        yield from RecursiveBruteForceSolver._solutions_recursive(
+                            board, occ | bit, atk | mask, h, placed, pieces, remaining - 1)
+                        placed.pop()
+                        counter[1] += 1
+                        counter[2] = last_square
+
+        if 1 < len(board.pieces) + len(placed) <= 5:
+            completed_table[zhash & completed_mask] = zhash
+
+
+class ParallelBruteForceSolver(RecursiveBruteForceSolver):
+    """ Parallel recursive brute force solver
+
+    Splits the search of the RecursiveBruteForceSolver by the slot of the first
+    piece of the scarcest kind. Since pieces of the same kind are placed in
+    increasing slot order, every subtree holds a disjoint set of solutions.
+
+    Every subtree is split again by the slot of the next piece (the next piece of
+    the same kind, or the first piece of another kind), so the search is divided
+    into many small jobs which keep all the worker processes busy. The symmetric
+    solutions are expanded in the main process.
+
+    Every job allocates its own explored configurations table, so the peak memory
+    used by the tables is ``workers * 8 * 2^memoize_bits`` bytes.
+
+    Args:
+        rows: Row count
+        cols: Column count
+        pieces: List of tuples of two elements (Piece, Count)
+        memoize_bits (optional): Size in bits of the explored configurations table
+        workers (optional): Worker processes count, by default the CPU count
+    """
+
+    def __init__(self, rows: int, cols: int, pieces: list, memoize_bits: int=MEMOIZE_BITS_DEFAULT,
+                 workers: int=None):
+        super().__init__(rows, cols, pieces, memoize_bits)
+        self.workers = workers
+
+    @classmethod
+    def identifier(cls):
+        return 'parallel'
 
-        if 1 < len(board.pieces) <= 5:
-            RecursiveBruteForceSolver.completed_set.add(hash(frozenset(board.pieces)))
+    def _solutions(self):
+        available_pieces = self._available_pieces()
+        if not available_pieces:
+            return
+
+        root = self._root(available_pieces)
+        if available_pieces[root][1] > 1:
+            split = root
+        else:
+            split = next((index for index in range(len(available_pieces)) if index != root), None)
+
+        squares = range(self.rows * self.cols)
+        if split is None:
+            jobs = [[(root, square)] for square in self._root_squares()]
+        else:
+            root_masks = available_pieces[root][3]
+            split_masks = available_pieces[split][3]
+            jobs = [[(root, square), (split, next_square)]
+                    for square in self._root_squares() for next_square in squares
+                    if next_square != square and (split != root or next_square > square)
+                    and not root_masks[square] >> next_square & 1
+                    and not split_masks[next_square] >> square & 1]
+
+        seen = {}
+        with ProcessPoolExecutor(self.workers) as executor:
+            futures = {
+                executor.submit(ParallelBruteForceSolver._solve_subtree,
+                                self.rows, self.cols, available_pieces, roots, self.memoize_bits)
+                for roots in jobs
+            }
+            try:
+                for future in as_completed(futures):
+                    futures.discard(future)
+                    for solution in future.result():
+                        yield from RecursiveBruteForceSolver._symmetric_solutions(solution, seen)
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def _solve_subtree(rows: int, cols: int, pieces: list, roots: list, memoize_bits: int) -> list:
+        """Solutions which start with the given pieces placements
+
+        Args:
+            rows: Row count
+            cols: Column count
+            pieces: List of lists of five elements [PieceId, Count, Last, Masks, Keys]
+            roots: List of tuples of two elements (Index, Slot) with the index in *pieces*
+                of the kind placed and its slot number, in placement order
+            memoize_bits: Size in bits of the explored configurations table
+
+        Returns:
+            list: Solution boards
+        """
+        return list(RecursiveBruteForceSolver._solutions_subtree(rows, cols, pieces, roots, memoize_bits))
 
 
 SOLVERS_LIST = (
     RecursiveBruteForceSolver,
+    ParallelBruteForceSolver,
 )
 
 SOLVERS_DICT = {solver.identifier(): solver for solver in SOLVERS_LIST}
@@ -7,10 +7,14 @@ to solve the chess challenge.
 
 Attributes:
     PIECES_LIST (tuple): List of available pieces
+    PIECES_DICT (dict): Dictionary which maps identifiers to pieces
+    ZOBRIST_MASK (int): Mask of the 64 bits kept in the boards Zobrist hashes
 """
 
 from abc import ABCMeta, abstractmethod
-from numpy import ndarray, zeros, uint8, uint16
+from functools import lru_cache, reduce
+from operator import or_
+from random import Random
 
 
 _KING_QUEEN_MOVES = (
@@ -251,25 +255,46 @@ class KnightPiece(AbstractPiece):
 
 PIECES_LIST = (KingPiece, QueenPiece, BishopPiece, RookPiece, KnightPiece)
 
+PIECES_DICT = {piece.identifier(): piece for piece in PIECES_LIST}
+
+ZOBRIST_MASK = 0xFFFFFFFFFFFFFFFF
+
+_zobrist_random = Random(0x5EED)
+_ZOBRIST_TABLE = {
+    (piece.identifier(), row, col): _zobrist_random.getrandbits(64)
+    for piece in PIECES_LIST for row in range(64) for col in range(64)
+}
+
 
 class Board:
-    __slots__ = ['state', '_next_row', '_next_col', 'pieces']
+    __slots__ = ['rows', 'cols', 'full', 'occ', 'atk', 'pieces', 'zhash']
 
     @staticmethod
     def new(rows: int, cols: int):
-        state = zeros((rows, cols), dtype=uint8)
-        return Board(state)
+        return Board(rows, cols)
 
-    def __init__(self, state: ndarray, next_position: tuple=(0, 0), pieces=None):
+    def __init__(self, rows: int, cols: int, occ: int=0, atk: int=0, pieces=None, zhash: int=0):
         """Board representation
 
+        The state of the board is stored in two bitboards, one bit per slot. The slot
+        (row, column) is mapped to the bit ``row * cols + column``. The *full*
+        attribute holds the bitboard with every slot of the board set.
+
         Args:
-            state: State of each slot in the board
-            next_position (optional): Next available position (row, column)
+            rows: Row count
+            cols: Column count
+            occ (optional): Bitboard of the slots occupied by pieces
+            atk (optional): Bitboard of the slots attacked by pieces
+            pieces (optional): Set of piece hashes
+            zhash (optional): Zobrist hash of the pieces in the board
         """
-        self.state = state
-        self._next_row, self._next_col = next_position
+        self.rows = rows
+        self.cols = cols
+        self.full = (1 << (rows * cols)) - 1
+        self.occ = occ
+        self.atk = atk
         self.pieces = pieces if pieces is not None else set()
+        self.zhash = zhash
 
     def add_piece(self, piece: AbstractPiece, row: int, col: int) -> bool:
         """Try to add a new piece to the board
@@ -279,9 +304,10 @@ class Board:
             row: Row number starting at 0
             col: Column number starting at 0
 
-        Adding the piece to the board implies to set the piece in the *status* matrix
-        in the specified position using the piece identifier. Also adds the hash
-        of the piece to the *piece* set.
+        Adding the piece to the board implies to set the bit of the specified position
+        in the *occ* bitboard and the bits of the positions it attacks in the *atk*
+        bitboard. Also adds the hash of the piece to the *piece* set and updates
+        the *zhash* of the board.
 
         The *piece* hash is a 16bit integer number:
             - 6 bits for row number
@@ -291,30 +317,71 @@ class Board:
         Returns:
             int: True if the piece was added successfully, False otherwise
         """
-        if self.state[row][col] != 0:
-            return False
+        piece_id = piece.identifier()
+        square = row * self.cols + col
+        return self.place(piece_id, square, attack_masks(piece_id, self.rows, self.cols)[square]) is not None
 
-        for drow, dcol in piece.positions(self, row, col):
-            if self.state[drow][dcol] > 1:
-                return False
-        else:
-            self.state[row][col] = piece.identifier()
-            for drow, dcol in piece.positions(self, row, col):
-                self.state[drow][dcol] = 1
+    def place(self, piece_id: int, square: int, mask: int) -> int:
+        """Try to add a new piece to the board given its slot number and attack mask
 
-            piece_hash = (piece.identifier() - 2) | (col << 4) | (row << 10)
-            self.pieces.add(uint16(piece_hash))
-            return True
+        This is the placement kernel used by *add_piece*. Solvers which already hold
+        the attack masks of a piece (see *attack_masks*) can call it directly and
+        revert the placement with *undo* instead of copying the board.
 
-    @property
-    def rows(self) -> int:
-        """Board row count"""
-        return self.state.shape[0]
+        Args:
+            piece_id: Piece identifier
+            square: Slot number (``row * cols + column``)
+            mask: Bitmask of the slots attacked by the piece from *square*
+
+        Returns:
+            int: Bitmask of the slots newly attacked by the piece if it was added
+            successfully, None otherwise. The bitmask is 0 when every slot the piece
+            attacks was already attacked, so callers must test the result with
+            ``is None`` instead of its truth value.
+        """
+        bit = 1 << square
+        if (self.occ | self.atk) & bit or mask & self.occ:
+            return None
+
+        added = mask & ~self.atk
+        self.occ |= bit
+        self.atk |= mask
+
+        row, col = divmod(square, self.cols)
+        piece_hash = (piece_id - 2) | (col << 4) | (row << 10)
+        self.pieces.add(piece_hash)
+        self.zhash = (self.zhash + _ZOBRIST_TABLE[piece_id, row, col]) & ZOBRIST_MASK
+        return added
+
+    def undo(self, piece_id: int, square: int, added: int):
+        """Removes the last piece added with *place*
+
+        Placements must be undone in reverse order.
+
+        Args:
+            piece_id: Piece identifier
+            square: Slot number (``row * cols + column``)
+            added: Bitmask of the slots newly attacked by the piece, as returned by *place*
+        """
+        self.occ ^= 1 << square
+        self.atk ^= added
+
+        row, col = divmod(square, self.cols)
+        self.pieces.discard((piece_id - 2) | (col << 4) | (row << 10))
+        self.zhash = (self.zhash - _ZOBRIST_TABLE[piece_id, row, col]) & ZOBRIST_MASK
 
     @property
-    def cols(self) -> int:
-        """Board column count"""
-        return self.state.shape[1]
+    def state(self) -> list:
+        """State of each slot in the board as a list of rows
+
+        Free slots are represented by 0, attacked slots by 1 and occupied slots by
+        the identifier of the piece placed on them.
+        """
+        state = [[(self.atk >> (row * self.cols + col)) & 1 for col in range(self.cols)]
+                 for row in range(self.rows)]
+        for piece_hash in self.pieces:
+            state[piece_hash >> 10][(piece_hash >> 4) & 0x3F] = (piece_hash & 0x0F) + 2
+        return state
 
     def copy(self):
         """Creates new identical Board object
@@ -322,7 +389,7 @@ class Board:
         Returns:
             Board: Cloned object
         """
-        return Board(state=self.state.copy(), next_position=(self._next_row, self._next_col), pieces=self.pieces.copy())
+        return Board(self.rows, self.cols, self.occ, self.atk, self.pieces.copy(), self.zhash)
 
     def next_position(self) -> tuple:
         """Next available position in the board
@@ -330,18 +397,10 @@ class Board:
         Returns:
             tuple(int, int): Position (row, column)
         """
-        while self.state[self._next_row][self._next_col] != 0:
-            if self._next_col < self.cols - 1:
-                self._next_col += 1
-            elif self._next_row < self.rows - 1:
-                self._next_row += 1
-                self._next_col = 0
-            else:
-                return None, None
-
-        if self.state[self._next_row][self._next_col] != 0:
+        free = self.free
+        if not free:
             return None, None
-        return self._next_row, self._next_col
+        return divmod((free & -free).bit_length() - 1, self.cols)
 
     def available_positions(self):
         """Generator of board available positions
@@ -349,22 +408,142 @@ class Board:
         Yields:
             (int, int): Available row and column position in a tuple (row, column)
         """
-        next_row, next_col = self.next_position()
+        for square in self.available_squares():
+            yield divmod(square, self.cols)
 
-        if next_row is not None:
-            col = next_col
-            for row in range(next_row, self.rows):
-                while col < self.cols:
-                    if self.state[row][col] == 0:
-                        yield row, col
-                    col += 1
-                col = 0
+    def available_squares(self, start: int=0):
+        """Generator of board available slot numbers
+
+        Args:
+            start (optional): First slot number to consider
+
+        Yields:
+            int: Available slot number (``row * cols + column``)
+        """
+        free = self.free >> start << start
+        while free:
+            bit = free & -free
+            yield bit.bit_length() - 1
+            free ^= bit
+
+    @property
+    def free(self) -> int:
+        """Bitboard of the slots neither occupied nor attacked"""
+        return ~(self.occ | self.atk) & self.full
+
+    def symmetries(self) -> tuple:
+        """Slot permutations of the board symmetries
+
+        Square boards have the 8 symmetries of the square (rotations and reflections),
+        rectangular boards only the identity, both mirrors and the half turn. The
+        identity is always the first permutation.
+
+        Returns:
+            tuple: Permutations as tuples which map every slot number to its image
+        """
+        return board_symmetries(self.rows, self.cols)
+
+    def transform(self, permutation: tuple):
+        """Creates new Board with the pieces moved by a slot permutation
+
+        Args:
+            permutation: Tuple which maps every slot number to its image
+
+        Returns:
+            Board: Transformed board
+        """
+        board = Board.new(self.rows, self.cols)
+        for piece_hash in self.pieces:
+            piece_id = (piece_hash & 0x0F) + 2
+            square = permutation[(piece_hash >> 10) * self.cols + ((piece_hash >> 4) & 0x3F)]
+            board.place(piece_id, square, attack_masks(piece_id, self.rows, self.cols)[square])
+        return board
 
     def __hash__(self):
-        return hash(frozenset(self.pieces))
+        return self.zhash
 
     def __eq__(self, other):
-        return (self.state == other.state).all()
+        return self.occ == other.occ and self.atk == other.atk and self.pieces == other.pieces
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(piece_id: int, rows: int, cols: int) -> tuple:
+    """Zobrist keys of a piece for every slot of a board
+
+    The Zobrist hash of a board is the sum, modulo 2^64 (see ``ZOBRIST_MASK``), of
+    the keys of its pieces.
+
+    Args:
+        piece_id: Piece identifier
+        rows: Row count
+        cols: Column count
+
+    Returns:
+        tuple: Zobrist key indexed by slot number (``row * cols + column``)
+    """
+    return tuple(_ZOBRIST_TABLE[piece_id, row, col] for row in range(rows) for col in range(cols))
+
+
+@lru_cache(maxsize=None)
+def board_symmetries(rows: int, cols: int) -> tuple:
+    """Slot permutations of the symmetries of a board
+
+    Args:
+        rows: Row count
+        cols: Column count
+
+    Returns:
+        tuple: Permutations as tuples which map every slot number to its image, the
+        identity first
+    """
+    last_row, last_col = rows - 1, cols - 1
+    transforms = [
+        lambda row, col: (row, col),
+        lambda row, col: (row, last_col - col),
+        lambda row, col: (last_row - row, col),
+        lambda row, col: (last_row - row, last_col - col),
+    ]
+    if rows == cols:
+        transforms += [
+            lambda row, col: (col, row),
+            lambda row, col: (col, last_row - row),
+            lambda row, col: (last_col - col, row),
+            lambda row, col: (last_col - col, last_row - row),
+        ]
+
+    permutations = []
+    for transform in transforms:
+        permutation = []
+        for row in range(rows):
+            for col in range(cols):
+                trow, tcol = transform(row, col)
+                permutation.append(trow * cols + tcol)
+        permutations.append(tuple(permutation))
+    return tuple(permutations)
+
+
+@lru_cache(maxsize=None)
+def attack_masks(piece_id: int, rows: int, cols: int) -> tuple:
+    """Bitmasks of the slots attacked by a piece from every slot of a board
+
+    The masks are computed once per piece and board size from the piece *positions*
+    generator. Blockers are not taken into account since no piece can be placed
+    in an attacked slot.
+
+    Args:
+        piece_id: Piece identifier
+        rows: Row count
+        cols: Column count
+
+    Returns:
+        tuple: Attack bitmask indexed by slot number (``row * cols + column``)
+    """
+    piece = PIECES_DICT[piece_id]
+    board = Board.new(rows, cols)
+    return tuple(
+        reduce(or_, (1 << (drow * cols + dcol) for drow, dcol in piece.positions(board, row, col)), 0)
+        for row in range(rows) for col in range(cols)
+    )
 
 
 __author__ = 'Roberto Antonio Becerra García <idertator@gmail.com>'
@@ -18,7 +18,4 @@ setup(
         'Programming Language :: Python :: 3.4',
         'Programming Language :: Python :: 3.5',
     ],
-    requires=[
-        'numpy',
-    ]
 )
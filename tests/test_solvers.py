@@ -1,7 +1,8 @@
 import unittest
+from time import time
 
 from chess.structures import Board, KingPiece, QueenPiece, BishopPiece, RookPiece, KnightPiece
-from chess.solvers import RecursiveBruteForceSolver
+from chess.solvers import RecursiveBruteForceSolver, ParallelBruteForceSolver
 
 
 class TestRecursiveBruteForce(unittest.TestCase):
@@ -72,3 +73,104 @@ class TestRecursiveBruteForce(unittest.TestCase):
         solutions = [solution.pieces for solution in solver.solutions()]
 
         self.assertEqual(len(solutions), 4696)
+
+    def test_10_10_board(self):
+        pieces = [
+            (KingPiece, 2),
+        ]
+        solver = RecursiveBruteForceSolver(rows=10, cols=10, pieces=pieces)
+        solutions = [frozenset(solution.pieces) for solution in solver.solutions()]
+
+        self.assertEqual(len(solutions), 4608)
+        self.assertEqual(len(set(solutions)), 4608)
+
+    def test_5_5_board_small_memoize_table(self):
+        pieces = [
+            (KingPiece, 2),
+            (QueenPiece, 1),
+            (BishopPiece, 1),
+            (KnightPiece, 1),
+        ]
+        solver = RecursiveBruteForceSolver(rows=5, cols=5, pieces=pieces, memoize_bits=2)
+        solutions = {frozenset(solution.pieces) for solution in solver.solutions()}
+
+        self.assertEqual(len(solutions), 4696)
+
+    def test_memoize_bits_out_of_range(self):
+        pieces = [
+            (KingPiece, 1),
+        ]
+        with self.assertRaises(ValueError):
+            RecursiveBruteForceSolver(rows=3, cols=3, pieces=pieces, memoize_bits=-1)
+        with self.assertRaises(ValueError):
+            RecursiveBruteForceSolver(rows=3, cols=3, pieces=pieces, memoize_bits=29)
+
+
+class TestParallelBruteForce(unittest.TestCase):
+
+    def test_3_3_board_1_piece(self):
+        pieces = [
+            (KingPiece, 1),
+        ]
+        solver = ParallelBruteForceSolver(rows=3, cols=3, pieces=pieces, workers=2)
+        solutions = [frozenset(solution.pieces) for solution in solver.solutions()]
+
+        self.assertEqual(len(solutions), 9)
+        self.assertEqual(len(set(solutions)), 9)
+
+    def test_3_3_board(self):
+        pieces = [
+            (KingPiece, 2),
+            (RookPiece, 1),
+        ]
+        recursive = RecursiveBruteForceSolver(rows=3, cols=3, pieces=pieces)
+        parallel = ParallelBruteForceSolver(rows=3, cols=3, pieces=pieces, workers=2)
+
+        expected = {frozenset(solution.pieces) for solution in recursive.solutions()}
+        solutions = [frozenset(solution.pieces) for solution in parallel.solutions()]
+
+        self.assertEqual(len(solutions), 4)
+        self.assertEqual(set(solutions), expected)
+
+    def test_5_5_board(self):
+        pieces = [
+            (KingPiece, 2),
+            (QueenPiece, 1),
+            (BishopPiece, 1),
+            (KnightPiece, 1),
+        ]
+        solver = ParallelBruteForceSolver(rows=5, cols=5, pieces=pieces)
+        solutions = [solution.pieces for solution in solver.solutions()]
+
+        self.assertEqual(len(solutions), 4696)
+
+    def test_4_4_board_repeated_pieces(self):
+        pieces = [
+            (RookPiece, 2),
+            (KnightPiece, 4),
+        ]
+        recursive = RecursiveBruteForceSolver(rows=4, cols=4, pieces=pieces)
+        parallel = ParallelBruteForceSolver(rows=4, cols=4, pieces=pieces, workers=2)
+
+        expected = {frozenset(solution.pieces) for solution in recursive.solutions()}
+        solutions = [frozenset(solution.pieces) for solution in parallel.solutions()]
+
+        self.assertEqual(len(solutions), 8)
+        self.assertEqual(set(solutions), expected)
+
+    def test_close_stops_search(self):
+        pieces = [
+            (KingPiece, 2),
+            (QueenPiece, 1),
+            (BishopPiece, 1),
+            (RookPiece, 1),
+            (KnightPiece, 1),
+        ]
+        solver = ParallelBruteForceSolver(rows=7, cols=7, pieces=pieces, workers=2)
+
+        start = time()
+        solutions = solver.solutions()
+        self.assertIsInstance(next(solutions), Board)
+        solutions.close()
+
+        self.assertLess(time() - start, 10)
@@ -1,8 +1,7 @@
 import unittest
 
-from numpy import array, uint8
-
-from chess.structures import Board, KingPiece, QueenPiece, BishopPiece, RookPiece, KnightPiece
+from chess.structures import Board, KingPiece, QueenPiece, BishopPiece, RookPiece, KnightPiece, attack_masks, \
+    board_symmetries
 
 
 class StructuresTestCase(unittest.TestCase):
@@ -73,58 +72,58 @@ class TestBoard(StructuresTestCase):
 
     def test_add_piece_and_next_position(self):
         self.assertTrue(self.board.add_piece(KingPiece, 0, 3))
-        state = array([
+        state = [
             [0, 0, 1, 2, 1],
             [0, 0, 1, 1, 1],
             [0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0],
             [0, 0, 0, 0, 0],
-        ], dtype=uint8)
-        self.assertTrue((self.board.state == state).all())
+        ]
+        self.assertEqual(self.board.state, state)
         self.assertEqual(self.board.next_position(), (0, 0))
 
         self.assertTrue(self.board.add_piece(QueenPiece, 4, 4))
-        state = array([
+        state = [
             [1, 0, 1, 2, 1],
             [0, 1, 1, 1, 1],
             [0, 0, 1, 0, 1],
             [0, 0, 0, 1, 1],
             [1, 1, 1, 1, 3],
-        ], dtype=uint8)
-        self.assertTrue((self.board.state == state).all())
+        ]
+        self.assertEqual(self.board.state, state)
         self.assertEqual(self.board.next_position(), (0, 1))
 
         self.assertTrue(self.board.add_piece(BishopPiece, 1, 0))
-        state = array([
+        state = [
             [1, 1, 1, 2, 1],
             [4, 1, 1, 1, 1],
             [0, 1, 1, 0, 1],
             [0, 0, 1, 1, 1],
             [1, 1, 1, 1, 3],
-        ], dtype=uint8)
-        self.assertTrue((self.board.state == state).all())
+        ]
+        self.assertEqual(self.board.state, state)
         self.assertEqual(self.board.next_position(), (2, 0))
 
         self.assertTrue(self.board.add_piece(RookPiece, 3, 1))
-        state = array([
+        state = [
             [1, 1, 1, 2, 1],
             [4, 1, 1, 1, 1],
             [0, 1, 1, 0, 1],
             [1, 5, 1, 1, 1],
             [1, 1, 1, 1, 3],
-        ], dtype=uint8)
-        self.assertTrue((self.board.state == state).all())
+        ]
+        self.assertEqual(self.board.state, state)
         self.assertEqual(self.board.next_position(), (2, 0))
 
         self.assertTrue(self.board.add_piece(KnightPiece, 2, 0))
-        state = array([
+        state = [
             [1, 1, 1, 2, 1],
             [4, 1, 1, 1, 1],
             [6, 1, 1, 0, 1],
             [1, 5, 1, 1, 1],
             [1, 1, 1, 1, 3],
-        ], dtype=uint8)
-        self.assertTrue((self.board.state == state).all())
+        ]
+        self.assertEqual(self.board.state, state)
         self.assertEqual(self.board.next_position(), (2, 3))
 
         self.assertFalse(self.board.add_piece(KnightPiece, 2, 3))
@@ -138,6 +137,76 @@ class TestBoard(StructuresTestCase):
         self.assertFalse(self.board.add_piece(KingPiece, 2, 3))
         self.assertEqual(self.board.next_position(), (None, None))
 
+    def test_zobrist_hash(self):
+        self.assertEqual(self.board.zhash, 0)
+        other = Board.new(5, 5)
+
+        self.assertTrue(self.board.add_piece(KingPiece, 0, 3))
+        self.assertTrue(self.board.add_piece(QueenPiece, 4, 4))
+        self.assertTrue(other.add_piece(QueenPiece, 4, 4))
+        self.assertNotEqual(self.board.zhash, other.zhash)
+
+        self.assertTrue(other.add_piece(KingPiece, 0, 3))
+        self.assertEqual(self.board.zhash, other.zhash)
+        self.assertEqual(hash(self.board), hash(other))
+        self.assertEqual(self.board.copy().zhash, self.board.zhash)
+
+    def test_place_and_undo(self):
+        self.assertTrue(self.board.add_piece(KingPiece, 0, 3))
+        state = self.board.state
+        pieces = set(self.board.pieces)
+        zhash = self.board.zhash
+        atk = self.board.atk
+
+        masks = attack_masks(QueenPiece.identifier(), 5, 5)
+        self.assertIsNone(self.board.place(QueenPiece.identifier(), 3, masks[3]))
+        self.assertIsNone(self.board.place(QueenPiece.identifier(), 23, masks[23]))
+
+        added = self.board.place(QueenPiece.identifier(), 24, masks[24])
+        self.assertEqual(added, masks[24] & ~atk)
+        self.assertEqual(self.board.next_position(), (0, 1))
+
+        self.board.undo(QueenPiece.identifier(), 24, added)
+        self.assertEqual(self.board.state, state)
+        self.assertEqual(self.board.pieces, pieces)
+        self.assertEqual(self.board.zhash, zhash)
+        self.assertEqual(self.board.next_position(), (0, 0))
+
+    def test_symmetries(self):
+        self.assertEqual(len(board_symmetries(5, 5)), 8)
+        self.assertEqual(len(board_symmetries(3, 4)), 4)
+        for permutation in board_symmetries(5, 5) + board_symmetries(3, 4):
+            self.assertEqual(sorted(permutation), list(range(len(permutation))))
+        self.assertEqual(board_symmetries(3, 4)[0], tuple(range(12)))
+
+    def test_transform(self):
+        self.assertTrue(self.board.add_piece(KingPiece, 0, 1))
+        self.assertTrue(self.board.add_piece(RookPiece, 2, 4))
+
+        boards = [self.board.transform(permutation) for permutation in self.board.symmetries()]
+        self.assertEqual(boards[0], self.board)
+        self.assertEqual(len({board.zhash for board in boards}), 8)
+
+        expected = Board.new(5, 5)
+        self.assertTrue(expected.add_piece(KingPiece, 0, 3))
+        self.assertTrue(expected.add_piece(RookPiece, 2, 0))
+        self.assertIn(expected, boards)
+
+
+class TestAttackMasks(StructuresTestCase):
+
+    def test_masks_match_positions(self):
+        for piece in (KingPiece, QueenPiece, BishopPiece, RookPiece, KnightPiece):
+            masks = attack_masks(piece.identifier(), 5, 5)
+            self.assertEqual(len(masks), 25)
+            for row in range(5):
+                for col in range(5):
+                    positions = {drow * 5 + dcol for drow, dcol in piece.positions(self.board, row, col)}
+                    self.assertEqual(masks[row * 5 + col], sum(1 << square for square in positions))
+
+    def test_upper_left_king_mask(self):
+        self.assertEqual(attack_masks(KingPiece.identifier(), 5, 5)[0], 0b1100010)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file